@@ -19,14 +19,136 @@ NOEMA remains the "mind". Cognee is "long-term associative memory".
 import os
 import asyncio
 import logging
-from typing import Optional
-from pathlib import Path
+from typing import Callable, Optional
 
+import numpy as np
 import cognee
 from cognee.api.v1.search import SearchType
+from cognee.infrastructure.databases.vector.embeddings import get_embedding_engine
+
+from search_cache import SearchCache, make_key, normalize, warm_scan
 
 logger = logging.getLogger(__name__)
 
+# Search types used on every request, resolved once at import
+_INSIGHTS = SearchType.INSIGHTS
+_GRAPH = SearchType.GRAPH_COMPLETION
+
+# Single dataset that all evidence is added to, so Cognee keeps one set of
+# indexes instead of one per evidence item
+_DATASET = "evidence"
+
+
+# =============================================================================
+# Search Result Extraction
+# =============================================================================
+# Cognee returns different formats depending on search type. Each extractor
+# handles one format and returns (snippet, score, metadata), with score None
+# when the result carries none.
+
+def _from_dict(result: dict) -> tuple[str, Optional[float], dict]:
+    """Extract from a plain dict result."""
+    if "text" in result:
+        snippet = result["text"]
+    elif "content" in result:
+        snippet = result["content"]
+    else:
+        snippet = str(result)
+    return snippet, result.get("score"), result.get("metadata", {})
+
+
+def _from_payload(result) -> tuple[str, Optional[float], dict]:
+    """Extract from Cognee's data node format."""
+    return str(result.payload), getattr(result, "score", None), {}
+
+
+def _from_other(result) -> tuple[str, Optional[float], dict]:
+    """Extract from any other result by its string form."""
+    return str(result), None, {}
+
+
+# Extractor per result type, filled on first sight of each type
+_EXTRACTORS: dict[type, Callable] = {}
+
+
+def _get_extractor(result) -> Callable:
+    """Return the extractor for result's type, resolving it once per type."""
+    extractor = _EXTRACTORS.get(type(result))
+    if extractor is None:
+        if isinstance(result, dict):
+            extractor = _from_dict
+        elif hasattr(result, "payload"):
+            extractor = _from_payload
+        else:
+            extractor = _from_other
+        _EXTRACTORS[type(result)] = extractor
+    return extractor
+
+
+def _build_items(extracted: list[tuple[str, Optional[float], dict]]) -> list[dict]:
+    """
+    Build search items in the SearchItem wire shape.
+    
+    Scores are filled and clamped as one array instead of per item.
+    
+    Args:
+        extracted: (snippet, score, metadata) per result, in rank order
+    """
+    snippets, raw_scores, metadatas = zip(*extracted)
+    # None scores become NaN and take the fallback score for their rank
+    scores = np.array(raw_scores, dtype=np.float64)
+    fallback = 1.0 - 0.1 * np.arange(len(scores), dtype=np.float64)
+    scores = np.where(np.isnan(scores), fallback, scores)
+    np.clip(scores, 0.0, 1.0, out=scores)  # Clamp to [0, 1]
+    
+    return [
+        {
+            "cognee_id": f"result_{i}",
+            "snippet": snippet[:500],  # Truncate long snippets
+            "score": score,
+            "metadata": metadata
+        }
+        for i, (snippet, score, metadata) in enumerate(
+            zip(snippets, scores.tolist(), metadatas)
+        )
+    ]
+
+
+# =============================================================================
+# Ingest Helpers
+# =============================================================================
+
+def _enrich(
+    evidence_id: str,
+    content: str,
+    content_type: str,
+    metadata: dict
+) -> str:
+    """
+    Prepare content with metadata prefix for better retrieval.
+    
+    This helps Cognee understand the context. All evidence shares one
+    dataset, so the prefix also carries the evidence ID to identify
+    where retrieved content came from.
+    """
+    # Only the short prefix is formatted; content is joined with one concat
+    prefix = (
+        f"[evidence: {evidence_id}] [{content_type}] "
+        f"[source: {metadata.get('source', 'unknown')}]\n"
+    )
+    return prefix + content
+
+
+def _cognee_id(evidence_id: str) -> str:
+    """
+    Generate a Cognee ID for evidence.
+    
+    Cognee doesn't expose internal IDs directly, so we create a mapping
+    based on the evidence_id.
+    """
+    return f"cognee_{evidence_id}"
+
+
 # Cognee requires LLM configuration for embeddings
 # Set the API key before any Cognee operations
 def _configure_llm():
@@ -58,31 +180,62 @@ class CogneeClient:
         """
         self.data_dir = data_dir or os.getenv("COGNEE_DATA_DIR", "./cognee_data")
         self._initialized = False
-        # Track ingested evidence IDs to Cognee's internal IDs
-        self._evidence_map: dict[str, str] = {}
+        # Absolute data directory, set once Cognee has been pointed at it
+        self._data_path_str: Optional[str] = None
+        # Bound once so the search hot path skips the module attribute lookup
+        self._search_fn = cognee.search
+        # Search results cache; cleared whenever memory changes
+        self._cache = SearchCache(
+            maxsize=int(os.getenv("COGNEE_SEARCH_CACHE_SIZE", "512")),
+            semantic_maxsize=int(os.getenv("COGNEE_SEMANTIC_CACHE_SIZE", "512")),
+            threshold=float(os.getenv("COGNEE_SEMANTIC_CACHE_THRESHOLD", "0.95")),
+        )
+        self._semantic_cache = os.getenv("COGNEE_SEMANTIC_CACHE", "false").lower() == "true"
+        # Ingest buffer: (enriched content, future resolved once added)
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Running batch adds, referenced so they are not garbage collected
+        self._flushes: set[asyncio.Task] = set()
+        self._add_lock = asyncio.Lock()
+        self._batch_size = int(os.getenv("COGNEE_INGEST_BATCH_SIZE", "64"))
+        self._batch_wait = int(os.getenv("COGNEE_INGEST_BATCH_WAIT_MS", "0")) / 1000
+        self._warmup_timeout = float(os.getenv("COGNEE_WARMUP_TIMEOUT_S", "30"))
+    
+    @property
+    def initialized(self) -> bool:
+        """Whether initialize() has completed."""
+        return self._initialized
     
     async def initialize(self) -> None:
-        """Initialize Cognee with local storage configuration."""
+        """
+        Initialize Cognee with local storage configuration.
+        
+        Called once at service startup; ingest, cognify and search expect
+        the client to be initialized and do not call this themselves.
+        """
         if self._initialized:
             return
         
         # Configure LLM API key first
         _configure_llm()
         
-        # CRITICAL: Use absolute path to avoid Cognee v0.5+ path resolution bugs
-        # Cognee's multi-user storage paths lose the relative prefix when reading back
-        data_path = Path(self.data_dir).resolve()
-        data_path.mkdir(parents=True, exist_ok=True)
-        
-        # Configure Cognee to use local storage with absolute path
-        # LanceDB and Kuzu are the defaults - no cloud services
-        cognee.config.data_root_directory(str(data_path))
+        # Configured once; a retry after a failed initialize skips this
+        if self._data_path_str is None:
+            # CRITICAL: Use absolute path to avoid Cognee v0.5+ path resolution bugs
+            # Cognee's multi-user storage paths lose the relative prefix when reading back
+            data_path = os.path.abspath(self.data_dir)
+            os.makedirs(data_path, exist_ok=True)
+            
+            # Configure Cognee to use local storage with absolute path
+            # LanceDB and Kuzu are the defaults - no cloud services
+            cognee.config.data_root_directory(data_path)
+            self._data_path_str = data_path
         
         # Disable multi-user access control to avoid UUID-based path issues
         os.environ.setdefault("ENABLE_BACKEND_ACCESS_CONTROL", "false")
         
         self._initialized = True
-        logger.info(f"Cognee initialized with data directory: {data_path}")
+        logger.info("Cognee initialized with data directory: %s", self._data_path_str)
     
     async def ingest(
         self,
@@ -94,6 +247,14 @@ class CogneeClient:
         """
         Ingest evidence into Cognee.
         
+        With no add in flight the evidence is added straight away, so a
+        caller that ingests one item at a time pays no buffering delay.
+        Items arriving while an add is in flight are buffered and added
+        together in the next single cognee.add() call, made once that add
+        finishes (after the batch wait, if configured) or as soon as the
+        buffer reaches the batch size. This call returns after its item
+        has been added.
+        
         Args:
             evidence_id: NOEMA's evidence ID
             content: Raw text content to index
@@ -103,27 +264,124 @@ class CogneeClient:
         Returns:
             Cognee's internal ID for this evidence
         """
-        await self.initialize()
+        assert self._initialized, "client not initialized"
         
-        # Prepare content with metadata prefix for better retrieval
-        # This helps Cognee understand the context
-        enriched_content = f"[{content_type}] [source: {metadata.get('source', 'unknown')}]\n{content}"
+        added = asyncio.get_running_loop().create_future()
+        self._pending.append((_enrich(evidence_id, content, content_type, metadata), added))
         
-        # Add to Cognee
-        # Cognee.add() accepts text content
-        await cognee.add(
-            enriched_content,
-            dataset_name=f"evidence_{evidence_id}"
-        )
+        if self._add_lock.locked() and len(self._pending) < self._batch_size:
+            # Queue behind the add in flight so concurrent ingests share one add
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_wait())
+        else:
+            await self._flush()
+        
+        await added
         
-        # Generate a Cognee ID (Cognee doesn't expose internal IDs directly,
-        # so we create a mapping based on the evidence_id)
-        cognee_id = f"cognee_{evidence_id}"
-        self._evidence_map[evidence_id] = cognee_id
+        cognee_id = _cognee_id(evidence_id)
         
-        logger.info(f"Ingested evidence {evidence_id} as {cognee_id}")
+        logger.info("Ingested evidence %s as %s", evidence_id, cognee_id)
         return cognee_id
     
+    async def ingest_batch(self, items: list[dict]) -> list[str]:
+        """
+        Ingest a batch of evidence into Cognee with a single cognee.add().
+        
+        Bypasses the ingest buffer, for clients that batch on their side.
+        
+        Args:
+            items: Dicts with evidence_id, content, content_type and metadata
+            
+        Returns:
+            Cognee's internal IDs, in the order of items
+        """
+        assert self._initialized, "client not initialized"
+        
+        await self._add([
+            _enrich(
+                item["evidence_id"],
+                item["content"],
+                item["content_type"],
+                item["metadata"]
+            )
+            for item in items
+        ])
+        
+        cognee_ids = [_cognee_id(item["evidence_id"]) for item in items]
+        logger.info("Ingested batch of %d evidence items", len(cognee_ids))
+        return cognee_ids
+    
+    async def _flush_after_wait(self) -> None:
+        """Flush the ingest buffer once the batch wait has elapsed."""
+        if self._batch_wait > 0:
+            await asyncio.sleep(self._batch_wait)
+        # Clear first so _flush() does not cancel the running task
+        self._flush_task = None
+        await self._flush()
+    
+    async def _flush(self) -> None:
+        """
+        Add all buffered evidence to Cognee and resolve the waiting ingests.
+        
+        Waits for any add in flight, then takes up to a batch of what is
+        buffered by then.
+        Failures are delivered to the waiting ingest calls, not raised here.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        
+        # The batch add runs in a task of its own, shielded from the caller:
+        # the batch holds other ingests' items, so cancelling the caller
+        # must not cancel the add or leave their futures unresolved
+        flush = asyncio.create_task(self._flush_batch())
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+        await asyncio.shield(flush)
+    
+    async def _flush_batch(self) -> None:
+        """Take up to a batch from the buffer and add it; see _flush()."""
+        async with self._add_lock:
+            # At most one batch per add; leftovers get a flush of their own
+            batch = self._pending[:self._batch_size]
+            self._pending = self._pending[self._batch_size:]
+            if not batch:
+                return
+            if self._pending and self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_wait())
+            
+            try:
+                await self._add_unlocked([text for text, _ in batch])
+            except BaseException as e:
+                for _, added in batch:
+                    if added.done():
+                        continue
+                    if isinstance(e, asyncio.CancelledError):
+                        added.cancel()
+                    else:
+                        added.set_exception(e)
+                if not isinstance(e, Exception):
+                    raise
+            else:
+                for _, added in batch:
+                    if not added.done():
+                        added.set_result(None)
+    
+    async def _add(self, texts: list[str]) -> None:
+        """Add texts to Cognee's evidence dataset in one call."""
+        # Serialize adds so a flush (e.g. before cognify) waits for
+        # any add already in flight
+        async with self._add_lock:
+            await self._add_unlocked(texts)
+    
+    async def _add_unlocked(self, texts: list[str]) -> None:
+        """Add texts to Cognee; the caller holds _add_lock."""
+        try:
+            await cognee.add(texts, dataset_name=_DATASET)
+        finally:
+            # A failed or cancelled add may still have written some texts
+            self._cache.clear()
+    
     async def cognify(self) -> None:
         """
         Run Cognee's cognify process to build internal representations.
@@ -132,10 +390,16 @@ class CogneeClient:
         - Vector embeddings
         - Knowledge graph
         """
-        await self.initialize()
+        assert self._initialized, "client not initialized"
+        
+        # Make sure buffered evidence is part of this cognify
+        await self._flush()
+        while self._pending:
+            await self._flush()
         
         logger.info("Running cognee.cognify()...")
         await cognee.cognify()
+        self._cache.clear()
         
         logger.info("Cognify completed")
     
@@ -154,64 +418,70 @@ class CogneeClient:
         Returns:
             Dictionary with 'items' and 'graph_context'
         """
-        await self.initialize()
+        assert self._initialized, "client not initialized"
         
-        logger.info(f"Searching for: {query} (top_k={top_k})")
+        logger.info("Searching for: %s (top_k=%d)", query, top_k)
+        
+        key = make_key(query, top_k)
+        # Read before any await: if memory changes while this search runs,
+        # its result must not be cached
+        generation = self._cache.generation
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        embedding = None
+        if self._semantic_cache:
+            embedding = await self._embed_query(query)
+            if embedding is not None:
+                cached = self._cache.get_similar(embedding, top_k)
+                if cached is not None:
+                    self._cache.put(key, cached)
+                    return cached
         
         items = []
         graph_context = {"nodes": [], "edges": []}
+        # Partial or failed results are returned but not cached
+        failed = False
+        
+        # INSIGHTS returns relevant chunks with scores; GRAPH_COMPLETION the
+        # graph context. They are independent, so run them concurrently and
+        # handle failures as returned values below
+        search_results, graph_results = await asyncio.gather(
+            self._search_fn(_INSIGHTS, query_text=query),
+            self._search_fn(_GRAPH, query_text=query),
+            return_exceptions=True,
+        )
         
         try:
-            # Perform semantic search using INSIGHTS search type
-            # This returns relevant chunks with scores
-            search_results = await cognee.search(
-                SearchType.INSIGHTS,
-                query_text=query
-            )
+            if isinstance(search_results, Exception):
+                raise search_results
             
             # Process search results
             if search_results:
-                for i, result in enumerate(search_results[:top_k]):
-                    # Extract content and score from result
-                    # Cognee returns different formats depending on search type
-                    if isinstance(result, dict):
-                        snippet = result.get("text", result.get("content", str(result)))
-                        score = result.get("score", 1.0 - (i * 0.1))  # Fallback scoring
-                        metadata = result.get("metadata", {})
-                    elif hasattr(result, "payload"):
-                        # Handle Cognee's data node format
-                        snippet = str(result.payload) if hasattr(result, "payload") else str(result)
-                        score = getattr(result, "score", 1.0 - (i * 0.1))
-                        metadata = {}
-                    else:
-                        snippet = str(result)
-                        score = 1.0 - (i * 0.1)
-                        metadata = {}
-                    
-                    items.append({
-                        "cognee_id": f"result_{i}",
-                        "snippet": snippet[:500],  # Truncate long snippets
-                        "score": min(max(score, 0.0), 1.0),  # Clamp to [0, 1]
-                        "metadata": metadata
-                    })
+                items = _build_items([
+                    _get_extractor(result)(result)
+                    for result in search_results[:top_k]
+                ])
             
-            # Try to get graph context
+            # Graph context is optional
             try:
-                graph_results = await cognee.search(
-                    SearchType.GRAPH_COMPLETION,
-                    query_text=query
-                )
+                if isinstance(graph_results, Exception):
+                    raise graph_results
                 
                 if graph_results:
                     # Extract nodes and edges from graph results
-                    seen_nodes = set()
+                    # dict keeps first-seen order, so node output is deterministic
+                    seen_nodes: dict[str, None] = {}
                     for result in graph_results[:top_k]:
                         if hasattr(result, "name"):
-                            seen_nodes.add(str(result.name))
+                            seen_nodes[str(result.name)] = None
                         elif isinstance(result, dict):
                             if "name" in result:
-                                seen_nodes.add(result["name"])
+                                seen_nodes[result["name"]] = None
                             if "source" in result and "target" in result:
+                                # Keys follow the GraphEdge wire aliases so the
+                                # dict can be serialized as-is by the route
                                 graph_context["edges"].append({
                                     "from": result["source"],
                                     "to": result["target"],
@@ -222,24 +492,75 @@ class CogneeClient:
                     graph_context["nodes"] = list(seen_nodes)
                     
             except Exception as e:
-                logger.warning(f"Graph search failed (non-fatal): {e}")
+                logger.warning("Graph search failed (non-fatal): %s", e)
+                failed = True
                 
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             # Return empty results on error, don't crash
+            failed = True
         
-        return {
+        result = {
             "items": items,
             "graph_context": graph_context if graph_context["nodes"] or graph_context["edges"] else None
         }
+        if not failed:
+            self._cache.put(key, result, embedding, generation)
+        return result
+    
+    async def _embed_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Embed a query with Cognee's configured embedding engine.
+        
+        Returns:
+            Unit-normalized embedding, or None if embedding failed
+        """
+        try:
+            engine = get_embedding_engine()
+            vectors = await engine.embed_text([query])
+            return normalize(vectors[0])
+        except Exception as e:
+            logger.warning("Query embedding failed, skipping semantic cache: %s", e)
+            return None
+    
+    async def warmup(self) -> None:
+        """
+        Load the embedding model and open the stores ahead of the first request.
+        
+        Embeds and searches a dummy query without adding anything to memory,
+        and compiles the semantic cache scan when that cache is enabled.
+        Failures are logged, not raised. The dummy query is abandoned after
+        the warmup timeout, so a hung backend cannot block startup.
+        """
+        if self._semantic_cache:
+            try:
+                warm_scan()
+            except Exception as e:
+                logger.warning("Semantic cache warmup failed (non-fatal): %s", e)
+        
+        async def warm_stores() -> None:
+            await get_embedding_engine().embed_text(["warmup"])
+            await self._search_fn(_INSIGHTS, query_text="warmup")
+        
+        try:
+            await asyncio.wait_for(warm_stores(), timeout=self._warmup_timeout)
+            logger.info("Cognee warmup completed")
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Warmup timed out after %gs (non-fatal)", self._warmup_timeout
+            )
+        except Exception as e:
+            logger.warning("Warmup failed (non-fatal): %s", e)
     
     async def health_check(self) -> bool:
         """Check if Cognee is operational."""
+        if self._initialized:
+            return True
         try:
             await self.initialize()
             return True
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return False
 
 
@@ -7,31 +7,38 @@ Cognee serves as semantic memory infrastructure - NOT intelligence.
 Endpoints:
 - GET  /health  - Health check
 - POST /ingest  - Ingest evidence into Cognee
+- POST /ingest_batch - Ingest several evidence items in one Cognee call
 - POST /cognify - Build/update Cognee's internal representations
 - POST /search  - Retrieve relevant evidence snippets + graph context
 
 Run with:
-    uvicorn main:app --host 0.0.0.0 --port 8100 --reload
+    uvicorn main:app --host 0.0.0.0 --port 8100 --reload --loop uvloop --http httptools
 """
 
 import os
+import re
+import sys
 import logging
 from contextlib import asynccontextmanager
 
+import msgspec
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 
 from schemas import (
     HealthResponse,
     IngestRequest,
     IngestResponse,
+    IngestBatchRequest,
+    IngestBatchResponse,
+    IngestMetadata,
     CognifyResponse,
     SearchRequest,
     SearchResponse,
-    SearchItem,
-    GraphContext,
-    GraphEdge,
+    ValidationErrorResponse,
 )
 from cognee_client import get_cognee_client
 
@@ -40,12 +47,159 @@ load_dotenv()
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# msgspec Request/Response Handling
+# =============================================================================
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecResponse(JSONResponse):
+    """JSON response encoded with msgspec (Structs, dicts, lists)."""
+
+    def render(self, content) -> bytes:
+        return _encoder.encode(content)
+
+
+# "<message> - at `$.items[0].content`" -> message, path
+_ERROR_PATH = re.compile(r" - at `\$(.*)`$")
+_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+
+
+def _validation_error(e: msgspec.DecodeError) -> RequestValidationError:
+    """Convert a msgspec decode error into FastAPI's validation error."""
+    msg = str(e)
+    loc: list = ["body"]
+    match = _ERROR_PATH.search(msg)
+    if match:
+        msg = msg[:match.start()]
+        for key, index in _PATH_PART.findall(match.group(1)):
+            loc.append(int(index) if index else key)
+    error_type = "value_error" if isinstance(e, msgspec.ValidationError) else "json_invalid"
+    return RequestValidationError([{"type": error_type, "loc": loc, "msg": msg}])
+
+
+def msgspec_body(struct_type: type):
+    """
+    Build a dependency that decodes and validates the JSON request body.
+    
+    Used instead of FastAPI's Pydantic body handling for msgspec Structs.
+    Invalid bodies are rejected with 422 and FastAPI's usual
+    {"detail": [{"type", "loc", "msg"}]} body.
+    """
+    decoder = msgspec.json.Decoder(struct_type)
+    
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise _validation_error(e)
+    
+    return Depends(decode)
+
+
+# OpenAPI schemas for the msgspec types, which FastAPI cannot derive itself;
+# merged into the generated document by _openapi() below
+_SCHEMA_TYPES = [
+    HealthResponse,
+    IngestRequest,
+    IngestResponse,
+    IngestBatchRequest,
+    IngestBatchResponse,
+    CognifyResponse,
+    SearchRequest,
+    SearchResponse,
+    ValidationErrorResponse,
+]
+_schema_refs, _SCHEMA_COMPONENTS = msgspec.json.schema_components(
+    _SCHEMA_TYPES, ref_template="#/components/schemas/{name}"
+)
+_SCHEMA_REFS = dict(zip(_SCHEMA_TYPES, _schema_refs))
+
+
+def openapi_body(struct_type: type) -> dict:
+    """openapi_extra documenting struct_type as the JSON request body."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _SCHEMA_REFS[struct_type]}},
+        }
+    }
+
+
+def openapi_responses(struct_type: type, validated: bool = True) -> dict:
+    """responses= documenting struct_type as the 200 body (and 422 if validated)."""
+    responses = {
+        200: {
+            "description": "Successful Response",
+            "content": {"application/json": {"schema": _SCHEMA_REFS[struct_type]}},
+        }
+    }
+    if validated:
+        responses[422] = {
+            "description": "Validation Error",
+            "content": {
+                "application/json": {"schema": _SCHEMA_REFS[ValidationErrorResponse]}
+            },
+        }
+    return responses
+
+
+# =============================================================================
+# CORS
+# =============================================================================
+
+# Fixed headers: the service only serves known NOEMA clients.
+# In production, restrict the allowed origin.
+_CORS_ORIGIN_HEADER = (b"access-control-allow-origin", b"*")
+_PREFLIGHT_START = {
+    "type": "http.response.start",
+    "status": 204,
+    "headers": [
+        _CORS_ORIGIN_HEADER,
+        (b"access-control-allow-methods", b"POST, GET, OPTIONS"),
+        (b"access-control-allow-headers", b"content-type"),
+    ],
+}
+_PREFLIGHT_BODY = {"type": "http.response.body", "body": b""}
+
+
+class StaticCORSMiddleware:
+    """
+    ASGI middleware emitting constant CORS headers.
+    
+    OPTIONS preflights are answered with a constant 204 without reaching
+    the app; other responses get the allow-origin header appended.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS":
+            await send(_PREFLIGHT_START)
+            await send(_PREFLIGHT_BODY)
+            return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # New list: the response may own (and reuse) its header list
+                message["headers"] = [*message.get("headers", ()), _CORS_ORIGIN_HEADER]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -53,6 +207,8 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Cognee service...")
     client = get_cognee_client()
     await client.initialize()
+    # Pay the embedding model's cold start here rather than on the first request
+    await client.warmup()
     logger.info("Cognee service ready")
     
     yield
@@ -67,24 +223,44 @@ app = FastAPI(
     description="Semantic memory infrastructure for NOEMA. Stores and retrieves evidence only.",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=MsgspecResponse,
 )
 
-# Add CORS middleware for local development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict this
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+def _openapi() -> dict:
+    """Generate the OpenAPI document with the msgspec schema components."""
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(
+            _SCHEMA_COMPONENTS
+        )
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+# Compress larger responses (mostly /search snippets and graph context)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Add CORS middleware for local development; added last so it is outermost
+# and preflights never reach the rest of the stack
+app.add_middleware(StaticCORSMiddleware)
 
 
 # =============================================================================
 # Health Check
 # =============================================================================
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+# Shared by every healthy probe once the client is up; never mutated
+_HEALTH_OK = MsgspecResponse(HealthResponse(status="ok"))
+
+
+@app.get(
+    "/health",
+    response_model=None,
+    responses=openapi_responses(HealthResponse, validated=False),
+)
+async def health_check() -> MsgspecResponse:
     """
     Health check endpoint.
     
@@ -92,20 +268,32 @@ async def health_check() -> HealthResponse:
         Status indicating if the service is operational.
     """
     client = get_cognee_client()
+    if client.initialized:
+        return _HEALTH_OK
+    
     is_healthy = await client.health_check()
     
     if is_healthy:
-        return HealthResponse(status="ok")
+        return MsgspecResponse(HealthResponse(status="ok"))
     else:
-        return HealthResponse(status="error", message="Cognee initialization failed")
+        return MsgspecResponse(
+            HealthResponse(status="error", message="Cognee initialization failed")
+        )
 
 
 # =============================================================================
 # Ingest
 # =============================================================================
 
-@app.post("/ingest", response_model=IngestResponse)
-async def ingest_evidence(request: IngestRequest) -> IngestResponse:
+@app.post(
+    "/ingest",
+    response_model=None,
+    responses=openapi_responses(IngestResponse),
+    openapi_extra=openapi_body(IngestRequest),
+)
+async def ingest_evidence(
+    request: IngestRequest = msgspec_body(IngestRequest)
+) -> MsgspecResponse:
     """
     Ingest evidence into Cognee.
     
@@ -124,36 +312,84 @@ async def ingest_evidence(request: IngestRequest) -> IngestResponse:
     client = get_cognee_client()
     
     try:
-        # Prepare metadata dict
-        metadata = {
-            "source": request.metadata.source,
-            "timestamp": request.metadata.timestamp,
-        }
-        if request.metadata.extra:
-            metadata.update(request.metadata.extra)
-        
         # Ingest into Cognee
         cognee_id = await client.ingest(
             evidence_id=request.evidence_id,
             content=request.content,
             content_type=request.content_type,
-            metadata=metadata
+            metadata=_metadata_dict(request.metadata)
         )
         
-        logger.info(f"Ingested evidence {request.evidence_id} -> {cognee_id}")
-        return IngestResponse(cognee_id=cognee_id)
+        logger.info("Ingested evidence %s -> %s", request.evidence_id, cognee_id)
+        return MsgspecResponse(IngestResponse(cognee_id=cognee_id))
         
     except Exception as e:
-        logger.error(f"Ingest failed: {e}")
+        logger.error("Ingest failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Ingest failed: {str(e)}")
 
 
+@app.post(
+    "/ingest_batch",
+    response_model=None,
+    responses=openapi_responses(IngestBatchResponse),
+    openapi_extra=openapi_body(IngestBatchRequest),
+)
+async def ingest_evidence_batch(
+    request: IngestBatchRequest = msgspec_body(IngestBatchRequest)
+) -> MsgspecResponse:
+    """
+    Ingest several evidence items into Cognee in one call.
+    
+    Same contract as /ingest, for clients that batch on their side.
+    
+    Args:
+        request: Evidence items to ingest
+        
+    Returns:
+        Cognee's internal identifiers, in request order
+    """
+    client = get_cognee_client()
+    
+    try:
+        cognee_ids = await client.ingest_batch([
+            {
+                "evidence_id": item.evidence_id,
+                "content": item.content,
+                "content_type": item.content_type,
+                "metadata": _metadata_dict(item.metadata),
+            }
+            for item in request.items
+        ])
+        
+        logger.info("Ingested batch of %d evidence items", len(cognee_ids))
+        return MsgspecResponse(IngestBatchResponse(cognee_ids=cognee_ids))
+        
+    except Exception as e:
+        logger.error("Batch ingest failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Batch ingest failed: {str(e)}")
+
+
+def _metadata_dict(metadata: IngestMetadata) -> dict:
+    """Flatten request metadata into the dict passed to the client."""
+    result = {
+        "source": metadata.source,
+        "timestamp": metadata.timestamp,
+    }
+    if metadata.extra:
+        result.update(metadata.extra)
+    return result
+
+
 # =============================================================================
 # Cognify
 # =============================================================================
 
-@app.post("/cognify", response_model=CognifyResponse)
-async def run_cognify() -> CognifyResponse:
+@app.post(
+    "/cognify",
+    response_model=None,
+    responses=openapi_responses(CognifyResponse, validated=False),
+)
+async def run_cognify() -> MsgspecResponse:
     """
     Build/update Cognee's internal representations.
     
@@ -172,25 +408,35 @@ async def run_cognify() -> CognifyResponse:
     try:
         await client.cognify()
         logger.info("Cognify completed successfully")
-        return CognifyResponse(status="completed")
+        return MsgspecResponse(CognifyResponse(status="completed"))
         
     except Exception as e:
-        logger.error(f"Cognify failed: {e}")
-        return CognifyResponse(status="error", message=str(e))
+        logger.error("Cognify failed: %s", e)
+        return MsgspecResponse(CognifyResponse(status="error", message=str(e)))
 
 
 # =============================================================================
 # Search
 # =============================================================================
 
-@app.post("/search", response_model=SearchResponse)
-async def search_memory(request: SearchRequest) -> SearchResponse:
+@app.post(
+    "/search",
+    response_model=None,
+    responses=openapi_responses(SearchResponse),
+    openapi_extra=openapi_body(SearchRequest),
+)
+async def search_memory(
+    request: SearchRequest = msgspec_body(SearchRequest)
+) -> MsgspecResponse:
     """
     Search Cognee's memory for relevant evidence.
     
     This endpoint returns candidate evidence snippets and graph context.
     It does NOT filter, rank, or reason about results - that's NOEMA's job.
     
+    The client already builds dicts in the SearchResponse wire shape, so they
+    are encoded directly instead of being rebuilt as Structs.
+    
     Args:
         request: Search query and parameters
         
@@ -205,39 +451,15 @@ async def search_memory(request: SearchRequest) -> SearchResponse:
             top_k=request.topK
         )
         
-        # Convert to response schema
-        items = [
-            SearchItem(
-                cognee_id=item["cognee_id"],
-                snippet=item["snippet"],
-                score=item["score"],
-                metadata=item.get("metadata")
-            )
-            for item in results.get("items", [])
-        ]
-        
-        graph_context = None
-        if results.get("graph_context"):
-            gc = results["graph_context"]
-            edges = [
-                GraphEdge(
-                    from_node=e["from"],
-                    to_node=e["to"],
-                    relation=e["relation"],
-                    weight=e.get("weight")
-                )
-                for e in gc.get("edges", [])
-            ]
-            graph_context = GraphContext(
-                nodes=gc.get("nodes", []),
-                edges=edges
-            )
-        
-        logger.info(f"Search for '{request.query}' returned {len(items)} results")
-        return SearchResponse(items=items, graph_context=graph_context)
+        items = results["items"]
+        logger.info("Search for '%s' returned %d results", request.query, len(items))
+        return MsgspecResponse({
+            "items": items,
+            "graph_context": results.get("graph_context"),
+        })
         
     except Exception as e:
-        logger.error(f"Search failed: {e}")
+        logger.error("Search failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
@@ -253,5 +475,8 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True
+        reload=True,
+        # libuv event loop and C HTTP parser; uvloop does not support Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
     )
@@ -1,19 +1,42 @@
 """
-NOEMA Cognee Service - Pydantic Schemas
+NOEMA Cognee Service - msgspec Schemas
 
 These schemas define the API contract for the Cognee service.
 Cognee stores EVIDENCE ONLY - no mental models, experiences, or beliefs.
+
+Schemas are msgspec Structs: request bodies are decoded and validated,
+and responses encoded, by msgspec's C implementation (see main.py).
 """
 
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional, Literal, Union
+
+import msgspec
+from msgspec import Meta
+
+
+# =============================================================================
+# Errors
+# =============================================================================
+
+class ValidationErrorDetail(msgspec.Struct):
+    """A single request validation error, in FastAPI's format."""
+    type: Annotated[str, Meta(description="Error type")]
+    loc: Annotated[
+        list[Union[str, int]], Meta(description="Location of the error, starting with 'body'")
+    ]
+    msg: Annotated[str, Meta(description="Error message")]
+
+
+class ValidationErrorResponse(msgspec.Struct):
+    """Response for a request body that fails validation (422)."""
+    detail: list[ValidationErrorDetail]
 
 
 # =============================================================================
 # Health Check
 # =============================================================================
 
-class HealthResponse(BaseModel):
+class HealthResponse(msgspec.Struct):
     """Health check response."""
     status: Literal["ok", "error"] = "ok"
     message: Optional[str] = None
@@ -23,34 +46,49 @@ class HealthResponse(BaseModel):
 # Ingest
 # =============================================================================
 
-class IngestMetadata(BaseModel):
+class IngestMetadata(msgspec.Struct):
     """Metadata for ingested evidence."""
-    source: str = Field(..., description="Source of the evidence (sensor, file, etc.)")
-    timestamp: str = Field(..., description="ISO timestamp of when evidence was captured")
+    source: Annotated[str, Meta(description="Source of the evidence (sensor, file, etc.)")]
+    timestamp: Annotated[str, Meta(description="ISO timestamp of when evidence was captured")]
     # Additional metadata fields can be added here
-    extra: Optional[dict] = Field(default=None, description="Additional metadata")
+    extra: Annotated[Optional[dict], Meta(description="Additional metadata")] = None
 
 
-class IngestRequest(BaseModel):
+class IngestRequest(msgspec.Struct):
     """Request to ingest evidence into Cognee."""
-    evidence_id: str = Field(..., description="Unique ID from NOEMA's evidence store")
-    content: str = Field(..., description="Raw text content to index")
-    content_type: Literal["text", "log", "screenshot_ocr", "transcript"] = Field(
-        ..., description="Type of content being ingested"
-    )
-    metadata: IngestMetadata = Field(..., description="Evidence metadata")
+    evidence_id: Annotated[str, Meta(description="Unique ID from NOEMA's evidence store")]
+    content: Annotated[str, Meta(description="Raw text content to index")]
+    content_type: Annotated[
+        Literal["text", "log", "screenshot_ocr", "transcript"],
+        Meta(description="Type of content being ingested")
+    ]
+    metadata: Annotated[IngestMetadata, Meta(description="Evidence metadata")]
 
 
-class IngestResponse(BaseModel):
+class IngestResponse(msgspec.Struct):
     """Response after ingesting evidence."""
-    cognee_id: str = Field(..., description="Cognee's internal identifier for this evidence")
+    cognee_id: Annotated[str, Meta(description="Cognee's internal identifier for this evidence")]
+
+
+class IngestBatchRequest(msgspec.Struct):
+    """Request to ingest several evidence items in one call."""
+    items: Annotated[
+        list[IngestRequest], Meta(min_length=1, description="Evidence to ingest")
+    ]
+
+
+class IngestBatchResponse(msgspec.Struct):
+    """Response after ingesting a batch of evidence."""
+    cognee_ids: Annotated[
+        list[str], Meta(description="Cognee's internal identifiers, in request order")
+    ]
 
 
 # =============================================================================
 # Cognify
 # =============================================================================
 
-class CognifyResponse(BaseModel):
+class CognifyResponse(msgspec.Struct):
     """Response after running cognify/memify."""
     status: Literal["completed", "error"] = "completed"
     message: Optional[str] = None
@@ -60,40 +98,43 @@ class CognifyResponse(BaseModel):
 # Search
 # =============================================================================
 
-class SearchRequest(BaseModel):
+class SearchRequest(msgspec.Struct):
     """Request to search Cognee's memory."""
-    query: str = Field(..., description="Natural language search query")
-    topK: int = Field(default=5, ge=1, le=50, description="Number of results to return")
+    query: Annotated[str, Meta(description="Natural language search query")]
+    topK: Annotated[int, Meta(ge=1, le=50, description="Number of results to return")] = 5
 
 
-class SearchItem(BaseModel):
+class SearchItem(msgspec.Struct):
     """A single search result item."""
-    cognee_id: str = Field(..., description="Cognee's internal identifier")
-    snippet: str = Field(..., description="Relevant text snippet")
-    score: float = Field(..., ge=0.0, le=1.0, description="Relevance score")
-    metadata: Optional[dict] = Field(default=None, description="Associated metadata")
+    cognee_id: Annotated[str, Meta(description="Cognee's internal identifier")]
+    snippet: Annotated[str, Meta(description="Relevant text snippet")]
+    score: Annotated[float, Meta(ge=0.0, le=1.0, description="Relevance score")]
+    metadata: Annotated[Optional[dict], Meta(description="Associated metadata")] = None
 
 
-class GraphEdge(BaseModel):
+class GraphEdge(msgspec.Struct):
     """An edge in the knowledge graph."""
-    from_node: str = Field(..., alias="from", description="Source node")
-    to_node: str = Field(..., alias="to", description="Target node")
-    relation: str = Field(..., description="Relationship type")
-    weight: Optional[float] = Field(default=None, description="Edge weight")
-
-    class Config:
-        populate_by_name = True
+    from_node: Annotated[str, Meta(description="Source node")] = msgspec.field(name="from")
+    to_node: Annotated[str, Meta(description="Target node")] = msgspec.field(name="to")
+    relation: Annotated[str, Meta(description="Relationship type")]
+    weight: Annotated[Optional[float], Meta(description="Edge weight")] = None
 
 
-class GraphContext(BaseModel):
+class GraphContext(msgspec.Struct):
     """Graph context from Cognee's knowledge graph."""
-    nodes: list[str] = Field(default_factory=list, description="Relevant nodes")
-    edges: list[GraphEdge] = Field(default_factory=list, description="Relevant edges")
+    nodes: Annotated[list[str], Meta(description="Relevant nodes")] = msgspec.field(
+        default_factory=list
+    )
+    edges: Annotated[list[GraphEdge], Meta(description="Relevant edges")] = msgspec.field(
+        default_factory=list
+    )
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(msgspec.Struct):
     """Response from searching Cognee's memory."""
-    items: list[SearchItem] = Field(default_factory=list, description="Search results")
-    graph_context: Optional[GraphContext] = Field(
-        default=None, description="Related graph context"
+    items: Annotated[list[SearchItem], Meta(description="Search results")] = msgspec.field(
+        default_factory=list
     )
+    graph_context: Annotated[
+        Optional[GraphContext], Meta(description="Related graph context")
+    ] = None
@@ -0,0 +1,211 @@
+"""
+NOEMA Cognee Service - Search Result Cache
+
+In-memory cache placed in front of Cognee's search. It has two tiers:
+- Exact: LRU keyed on the normalized query text and top_k
+- Semantic (optional): nearest cached query by embedding similarity
+
+Entries hold the exact dict returned by CogneeClient.search. The cache
+must be cleared whenever Cognee's memory changes (ingest, cognify). Each
+clear starts a new generation; results computed under an older one are
+rejected so a search in flight across a clear cannot cache stale data.
+
+All methods are synchronous and never await, so they are atomic with
+respect to the event loop and need no lock.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Fall back to a numpy scan
+    njit = None
+
+
+CacheKey = tuple[str, int]
+
+
+def make_key(query: str, top_k: int) -> CacheKey:
+    """Build the exact-match cache key for a query."""
+    return (query.strip().lower(), top_k)
+
+
+def normalize(vector) -> Optional[np.ndarray]:
+    """Return vector as a float32 unit vector, or None if it is all zeros."""
+    v = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(v))
+    if norm == 0.0:
+        return None
+    return v / norm
+
+
+def quantize(vector: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Quantize a vector to int8 with symmetric max-abs scaling.
+
+    Returns:
+        (int8 vector, scale) such that vector ~= int8 vector * scale
+    """
+    scale = float(np.max(np.abs(vector))) / 127
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _scan(matrix, scales, q, q_scale):
+        """Similarity of q against every row of an int8 matrix."""
+        out = np.empty(matrix.shape[0], dtype=np.float32)
+        for i in prange(matrix.shape[0]):
+            # Accumulate in int32; int8 products would overflow narrower types
+            s = np.int32(0)
+            for j in range(matrix.shape[1]):
+                s += np.int32(matrix[i, j]) * np.int32(q[j])
+            out[i] = s * scales[i] * q_scale
+        return out
+else:
+    def _scan(matrix, scales, q, q_scale):
+        """Similarity of q against every row of an int8 matrix."""
+        # Accumulate in int32; int8 products would overflow narrower types
+        dots = matrix.astype(np.int32) @ q.astype(np.int32)
+        return dots * scales * q_scale
+
+
+def warm_scan() -> None:
+    """
+    Compile the scan kernel ahead of the first semantic lookup.
+
+    Numba compiles lazily, which would otherwise stall the event loop on
+    the first lookup. The dummy arguments match the types get_similar()
+    passes, so the compiled kernel is reused. No-op without numba.
+    """
+    if njit is None:
+        return
+    _scan(
+        np.zeros((1, 1), dtype=np.int8),
+        np.ones(1, dtype=np.float32),
+        np.zeros(1, dtype=np.int8),
+        np.float32(1.0),
+    )
+
+
+class SearchCache:
+    """
+    Two-tier cache for search results.
+
+    Semantic entries store unit-normalized query embeddings, so cosine
+    similarity against a probe reduces to a dot product. Embeddings are
+    kept as int8 with a per-vector scale, a quarter of the fp32 size.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        semantic_maxsize: int = 512,
+        threshold: float = 0.95
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of exact-match entries
+            semantic_maxsize: Maximum number of semantic entries
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.maxsize = maxsize
+        self.semantic_maxsize = semantic_maxsize
+        self.threshold = threshold
+        self._exact: OrderedDict[CacheKey, dict] = OrderedDict()
+        # Semantic entries as a ring buffer of parallel arrays. The int8
+        # vectors are one contiguous (semantic_maxsize, dim) matrix so a scan
+        # streams through memory; it is allocated on the first insert, once
+        # the embedding dimension is known.
+        self._matrix: Optional[np.ndarray] = None
+        self._scales = np.zeros(semantic_maxsize, dtype=np.float32)
+        self._top_ks = np.zeros(semantic_maxsize, dtype=np.int32)
+        self._results: list[Optional[dict]] = [None] * semantic_maxsize
+        self._count = 0
+        self._next = 0
+        # Bumped by clear(); see put()
+        self.generation = 0
+
+    def get(self, key: CacheKey) -> Optional[dict]:
+        """Return the exact-match result for key, if cached."""
+        result = self._exact.get(key)
+        if result is not None:
+            self._exact.move_to_end(key)
+        return result
+
+    def get_similar(self, embedding: np.ndarray, top_k: int) -> Optional[dict]:
+        """
+        Return the result of the most similar cached query, if any.
+
+        Only entries cached with the same top_k are considered.
+
+        Args:
+            embedding: Unit-normalized query embedding
+            top_k: Number of results requested
+        """
+        if self._count == 0 or embedding.shape[0] != self._matrix.shape[1]:
+            return None
+
+        q, q_scale = quantize(embedding)
+        n = self._count
+        sims = _scan(self._matrix[:n], self._scales[:n], q, np.float32(q_scale))
+        sims[self._top_ks[:n] != top_k] = -np.inf
+        best = int(np.argmax(sims))
+        if sims[best] > self.threshold:
+            return self._results[best]
+        return None
+
+    def put(
+        self,
+        key: CacheKey,
+        result: dict,
+        embedding: Optional[np.ndarray] = None,
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a search result.
+
+        Args:
+            key: Exact-match key from make_key()
+            result: Result dict returned by CogneeClient.search
+            embedding: Unit-normalized query embedding for the semantic tier
+            generation: Cache generation read before the search started;
+                        the result is dropped if the cache was cleared since
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        self._exact[key] = result
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+
+        if embedding is not None and self.semantic_maxsize > 0:
+            if self._matrix is None or embedding.shape[0] != self._matrix.shape[1]:
+                # First insert, or the embedding model changed
+                self._matrix = np.zeros(
+                    (self.semantic_maxsize, embedding.shape[0]), dtype=np.int8
+                )
+                self._count = 0
+                self._next = 0
+
+            # Overwrite the oldest slot once full
+            i = self._next
+            self._matrix[i], self._scales[i] = quantize(embedding)
+            self._top_ks[i] = key[1]
+            self._results[i] = result
+            self._next = (i + 1) % self.semantic_maxsize
+            self._count = min(self._count + 1, self.semantic_maxsize)
+
+    def clear(self) -> None:
+        """Drop all cached results and start a new generation."""
+        self.generation += 1
+        self._exact.clear()
+        self._results = [None] * self.semantic_maxsize
+        self._count = 0
+        self._next = 0
@@ -0,0 +1,41 @@
+"""
+Test helper: import cognee_client against a stub of the cognee package.
+
+Cognee is replaced by stub modules, so tests run without Cognee
+installed and without touching any storage. Import this module before
+cognee_client.
+"""
+
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def stub_cognee() -> None:
+    """Register a minimal stub of the cognee package in sys.modules."""
+    modules = {
+        name: types.ModuleType(name)
+        for name in (
+            "cognee",
+            "cognee.api",
+            "cognee.api.v1",
+            "cognee.api.v1.search",
+            "cognee.infrastructure",
+            "cognee.infrastructure.databases",
+            "cognee.infrastructure.databases.vector",
+            "cognee.infrastructure.databases.vector.embeddings",
+        )
+    }
+    modules["cognee"].search = None
+    modules["cognee"].add = None
+    modules["cognee.api.v1.search"].SearchType = types.SimpleNamespace(
+        INSIGHTS="INSIGHTS", GRAPH_COMPLETION="GRAPH_COMPLETION"
+    )
+    modules["cognee.infrastructure.databases.vector.embeddings"].get_embedding_engine = None
+    for name, module in modules.items():
+        sys.modules.setdefault(name, module)
+
+
+stub_cognee()
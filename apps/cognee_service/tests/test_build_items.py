@@ -0,0 +1,30 @@
+"""
+Tests for building search items from extracted Cognee results.
+"""
+
+import unittest
+
+import cognee_stub  # noqa: F401  (must precede cognee_client)
+import cognee_client
+
+
+class BuildItemsTest(unittest.TestCase):
+
+    def test_fallback_scores_by_rank(self):
+        items = cognee_client._build_items([("a", None, {}), ("b", None, {})])
+        self.assertEqual([item["score"] for item in items], [1.0, 0.9])
+
+    def test_scores_are_clamped(self):
+        items = cognee_client._build_items([("a", 1.5, {}), ("b", -0.5, {})])
+        self.assertEqual([item["score"] for item in items], [1.0, 0.0])
+
+    def test_more_results_than_top_k_cap(self):
+        # Cognee may return more results than SearchRequest's topK cap
+        items = cognee_client._build_items([("s", None, {})] * 60)
+        self.assertEqual(len(items), 60)
+        self.assertEqual(items[59]["score"], 0.0)
+        self.assertEqual(items[59]["cognee_id"], "result_59")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for CogneeClient's ingest buffer.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+import cognee_stub  # noqa: F401  (must precede cognee_client)
+import cognee_client
+
+
+_METADATA = {"source": "test", "timestamp": "2026-01-01T00:00:00Z"}
+
+
+class IngestBufferTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        with mock.patch.dict(os.environ, {"COGNEE_INGEST_BATCH_SIZE": "3"}):
+            self.client = cognee_client.CogneeClient()
+        self.client._initialized = True
+        self.added: list[list[str]] = []
+
+        async def add(texts, dataset_name):
+            await asyncio.sleep(0.05)
+            self.added.append(texts)
+
+        patcher = mock.patch.object(cognee_client.cognee, "add", add, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _ingest(self, evidence_id: str) -> asyncio.Task:
+        return asyncio.create_task(
+            self.client.ingest(evidence_id, "content", "text", _METADATA)
+        )
+
+    async def test_cancelled_flush_caller_does_not_strand_batch(self):
+        # Hold the lock as if an add were in flight so the ingests are
+        # buffered; the third fills the batch and flushes it
+        await self.client._add_lock.acquire()
+        first, second, third = self._ingest("e1"), self._ingest("e2"), self._ingest("e3")
+        await asyncio.sleep(0)
+        self.client._add_lock.release()
+
+        # Cancel the ingest that owns the flush while the add is running
+        await asyncio.sleep(0.01)
+        third.cancel()
+
+        results = await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+        self.assertEqual(results, ["cognee_e1", "cognee_e2"])
+        self.assertEqual(len(self.added), 1)
+        self.assertEqual(len(self.added[0]), 3)
+        with self.assertRaises(asyncio.CancelledError):
+            await third
+
+
+if __name__ == "__main__":
+    unittest.main()